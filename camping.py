@@ -197,11 +197,12 @@ def check_park(
     park_information = get_park_information(
         park_id, start_date, end_date, campsite_type, campsite_ids, excluded_site_ids=excluded_site_ids,
     )
-    LOG.debug(
-        "Information for park {}: {}".format(
-            park_id, json.dumps(park_information, indent=2)
+    if LOG.isEnabledFor(logging.DEBUG):
+        LOG.debug(
+            "Information for park {}: {}".format(
+                park_id, json.dumps(park_information, indent=2)
+            )
         )
-    )
     park_name = RecreationClient.get_park_name(park_id)
     current, maximum, availabilities_filtered = get_num_available_sites(
         park_information, start_date, end_date, nights=nights, weekends_only=weekends_only,
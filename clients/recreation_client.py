@@ -3,7 +3,7 @@ import logging
 import requests
 import user_agent 
 
-from utils import formatter
+from utils import formatter, jsonlib
 
 LOG = logging.getLogger(__name__)
 
@@ -23,6 +23,19 @@ class RecreationClient:
     PERMIT_MAIN_PAGE_ENDPOINT = BASE_URL + "/api/permits/{permit_id}"
 
     headers = {"User-Agent": user_agent.generate_user_agent() }
+
+    # Most connections kept open to recreation.gov at once. Callers fetching
+    # more permits/months concurrently than this wait for a free connection.
+    MAX_CONNECTIONS = 32
+
+    # Shared session so repeated requests reuse HTTP connections.
+    session = requests.Session()
+    session.mount(
+        BASE_URL,
+        requests.adapters.HTTPAdapter(
+            pool_maxsize=MAX_CONNECTIONS, pool_block=True
+        ),
+    )
     
     @classmethod
     def get_availability(cls, park_id, month_date):
@@ -60,7 +73,7 @@ class RecreationClient:
 
     @classmethod
     def _send_request(cls, url, params):
-        resp = requests.get(url, params=params, headers=cls.headers)
+        resp = cls.session.get(url, params=params, headers=cls.headers)
         if resp.status_code != 200:
             raise RuntimeError(
                 "failedRequest",
@@ -68,4 +81,4 @@ class RecreationClient:
                     status_code=resp.status_code, url=url, resp_text=resp.text
                 ),
             )
-        return resp.json()
+        return jsonlib.loads(resp.content)
@@ -1,19 +1,15 @@
 # -*- coding: utf-8 -*-
 #!/usr/bin/env python3
 
-import json
 import logging
-import sys
-from collections import defaultdict
-from datetime import datetime, timedelta
-from itertools import count, groupby
-
-from dateutil import rrule
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
 
 from clients.recreation_client import RecreationClient
 from enums.date_format import DateFormat
 from enums.emoji import Emoji
-from utils import formatter
+from utils import formatter, jsonlib
 from utils.rafting_argparser import RaftingArgumentParser
 
 LOG = logging.getLogger(__name__)
@@ -24,12 +20,20 @@ sh = logging.StreamHandler()
 sh.setFormatter(log_formatter)
 LOG.addHandler(sh)
 
+# Most workers in each thread pool. The month pools run inside the permit pool,
+# so more requests can be in flight in total; RecreationClient.MAX_CONNECTIONS
+# caps the connections actually open to recreation.gov.
+MAX_WORKERS = 8
+
 
-def get_permit_information(permit_id, start_date, end_date):
+def get_permit_information(permit_id, start_date, end_date, permit_info=None):
     """
     Fetches permit availability from recreation.gov for the given permit ID
     and date range.
 
+    `permit_info` is the response of RecreationClient.get_permit_info for this
+    permit. Pass it in if you already have it to avoid fetching it again.
+
     The permit availability API returns data structured by "divisions"
     (entry points / river sections). Each division has date_availability
     with total and remaining permit counts per day.
@@ -48,23 +52,36 @@ def get_permit_information(permit_id, start_date, end_date):
     """
 
     # Get each first of the month for months in the range we care about.
-    start_of_month = datetime(start_date.year, start_date.month, 1)
-    months = list(
-        rrule.rrule(rrule.MONTHLY, dtstart=start_of_month, until=end_date)
-    )
-
-    # Get data for each month.
-    api_data = []
-    for month_date in months:
-        resp = RecreationClient.get_permit_availability(permit_id, month_date)
-
-        api_data.append(resp)
+    # end_date is exclusive, so a month starting on end_date is not needed.
+    months = []
+    year, month = start_date.year, start_date.month
+    while datetime(year, month, 1) < end_date:
+        months.append(datetime(year, month, 1))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+    # Get data for each month. The requests are independent so fetch them
+    # concurrently; map() keeps the results in month order.
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(MAX_WORKERS, len(months)))
+    ) as ex:
+        api_data = list(
+            ex.map(
+                lambda month_date: RecreationClient.get_permit_availability(
+                    permit_id, month_date
+                ),
+                months,
+            )
+        )
 
     # Get permit info to resolve division names.
-    permit_info = RecreationClient.get_permit_info(permit_id)
+    if permit_info is None:
+        permit_info = RecreationClient.get_permit_info(permit_id)
     divisions_info = permit_info.get("payload", {}).get("divisions", {})
 
     # Collapse the data into the described output format.
+    response_format = DateFormat.ISO_DATE_FORMAT_RESPONSE.value
+    start_str = formatter.format_date(start_date, format_string=response_format)
+    end_str = formatter.format_date(end_date, format_string=response_format)
     data = {}
 
     for month_data in api_data:
@@ -73,33 +90,31 @@ def get_permit_information(permit_id, start_date, end_date):
 
 
         for division_id, division_data in availability.items():
-            if division_id not in data:
+            division = data.get(division_id)
+            if division is None:
                 div_info = divisions_info.get(str(division_id), {})
-                data[division_id] = {
+                division = data[division_id] = {
                     "name": div_info.get("name", "Division {}".format(division_id)),
                     "available_dates": [],
                 }
 
+            append = division["available_dates"].append
             date_availability = division_data.get("date_availability", {})
             for date_str, avail_info in date_availability.items():
                 remaining = avail_info.get("remaining", 0)
-                total = avail_info.get("total", 0)
-
                 if remaining <= 0:
                     continue
 
-                # Parse date and filter to requested range.
-                date_obj = datetime.strptime(
-                    date_str, DateFormat.ISO_DATE_FORMAT_RESPONSE.value
-                )
-                if date_obj < start_date or date_obj >= end_date:
+                # Filter to requested range. The keys are fixed-width ISO
+                # strings, so comparing them directly orders them by date.
+                if date_str < start_str or date_str >= end_str:
                     continue
 
-                data[division_id]["available_dates"].append(
+                append(
                     {
                         "date": date_str,
                         "remaining": remaining,
-                        "total": total,
+                        "total": avail_info.get("total", 0),
                     }
                 )
 
@@ -110,9 +125,25 @@ def get_permit_information(permit_id, start_date, end_date):
     return data
 
 
-def is_weekend(date):
-    weekday = date.weekday()
-    return weekday == 4 or weekday == 5
+@lru_cache(maxsize=4096)
+def _parse_iso(date_str):
+    """
+    Parse a date string from the API. Every division reports the same dates,
+    so the result is cached.
+
+    Dates always look like DateFormat.ISO_DATE_FORMAT_RESPONSE, so strip the
+    trailing "Z" and use fromisoformat, which is much faster than strptime.
+    """
+    return datetime.fromisoformat(date_str[:-1])
+
+
+@lru_cache(maxsize=1024)
+def _format_api_date(date_str, format_string):
+    """
+    Reformat a date string from the API, e.g. for human output. Cached for
+    the same reason as _parse_iso.
+    """
+    return formatter.format_date(_parse_iso(date_str), format_string=format_string)
 
 
 def get_num_available_dates(
@@ -122,16 +153,9 @@ def get_num_available_dates(
     Given permit information, count the number of divisions that have
     available dates in the requested range, and organize results.
     """
-    num_days = (end_date - start_date).days
-    dates_in_range = [end_date - timedelta(days=i) for i in range(1, num_days + 1)]
-    if weekends_only:
-        dates_in_range = list(filter(is_weekend, dates_in_range))
-    dates_in_range_set = set(
-        formatter.format_date(
-            i, format_string=DateFormat.ISO_DATE_FORMAT_RESPONSE.value
-        )
-        for i in dates_in_range
-    )
+    # Compare dates as day ordinals rather than building every date in range.
+    start_ord = start_date.toordinal()
+    end_ord = end_date.toordinal()
 
     available_divisions = {}
     total_divisions = len(permit_information)
@@ -141,8 +165,15 @@ def get_num_available_dates(
         matching_dates = []
 
         for avail in division_data["available_dates"]:
-            if avail["date"] in dates_in_range_set and avail["remaining"] >= min_permits:
-                matching_dates.append(avail)
+            if avail["remaining"] < min_permits:
+                continue
+            day_ord = _parse_iso(avail["date"]).toordinal()
+            if not start_ord <= day_ord < end_ord:
+                continue
+            # Ordinal 1 is a Monday, so Fridays and Saturdays are 5 and 6 mod 7.
+            if weekends_only and day_ord % 7 not in (5, 6):
+                continue
+            matching_dates.append(avail)
 
         if matching_dates:
             available_divisions[division_id] = {
@@ -154,14 +185,17 @@ def get_num_available_dates(
 
 
 def check_permit(permit_id, start_date, end_date, weekends_only=False, min_permits=1):
-    permit_information = get_permit_information(permit_id, start_date, end_date)
-    LOG.debug(
-        "Information for permit {}: {}".format(
-            permit_id, json.dumps(permit_information, indent=2)
-        )
+    permit_info = RecreationClient.get_permit_info(permit_id)
+    permit_information = get_permit_information(
+        permit_id, start_date, end_date, permit_info=permit_info
     )
+    if LOG.isEnabledFor(logging.DEBUG):
+        LOG.debug(
+            "Information for permit {}: {}".format(
+                permit_id, jsonlib.dumps(permit_information, pretty=True)
+            )
+        )
 
-    permit_info = RecreationClient.get_permit_info(permit_id)
     permit_name = permit_info.get("payload", {}).get("name", "Permit {}".format(permit_id))
 
     current, maximum, available_divisions = get_num_available_dates(
@@ -185,49 +219,31 @@ def generate_human_output(
             emoji = Emoji.RAFTING_FAILURE.value
 
         out.append(
-            "{emoji} {permit_name} ({permit_id}): {current} division(s) with availability out of {maximum} division(s)".format(
-                emoji=emoji,
-                permit_name=permit_name,
-                permit_id=permit_id,
-                current=current,
-                maximum=maximum,
-            )
+            f"{emoji} {permit_name} ({permit_id}): {current} division(s) "
+            f"with availability out of {maximum} division(s)"
         )
 
         # Always show available dates. Show division headers when >1 division.
         if available_divisions:
             show_division_headers = len(available_divisions) > 1 or maximum > 1
+            date_prefix = "    * " if show_division_headers else "  * "
+            date_format = DateFormat.INPUT_DATE_FORMAT.value
             for division_id, div_data in available_divisions.items():
                 if show_division_headers:
-                    out.append(
-                        "  * {name} (Division {div_id}):".format(
-                            name=div_data["name"], div_id=division_id
-                        )
-                    )
+                    out.append(f"  * {div_data['name']} (Division {division_id}):")
                 for date_info in div_data["dates"]:
-                    date_nice = formatter.format_date(
-                        datetime.strptime(
-                            date_info["date"],
-                            DateFormat.ISO_DATE_FORMAT_RESPONSE.value,
-                        ),
-                        format_string=DateFormat.INPUT_DATE_FORMAT.value,
-                    )
+                    date_nice = _format_api_date(date_info["date"], date_format)
                     out.append(
-                        "  {indent}* {date}: {remaining}/{total} permits remaining".format(
-                            indent="  " if show_division_headers else "",
-                            date=date_nice,
-                            remaining=date_info["remaining"],
-                            total=date_info["total"],
-                        )
+                        f"{date_prefix}{date_nice}: "
+                        f"{date_info['remaining']}/{date_info['total']} permits remaining"
                     )
 
     if has_availabilities:
+        input_format = DateFormat.INPUT_DATE_FORMAT.value
         out.insert(
             0,
-            "there are permits available from {start} to {end}!!!".format(
-                start=start_date.strftime(DateFormat.INPUT_DATE_FORMAT.value),
-                end=end_date.strftime(DateFormat.INPUT_DATE_FORMAT.value),
-            ),
+            f"there are permits available from {start_date.strftime(input_format)} "
+            f"to {end_date.strftime(input_format)}!!!",
         )
     else:
         out.insert(0, "There are no permits available :(")
@@ -243,19 +259,26 @@ def generate_json_output(info_by_permit_id):
             has_availabilities = True
             availabilities_by_permit_id[permit_id] = available_divisions
 
-    return json.dumps(availabilities_by_permit_id), has_availabilities
+    return jsonlib.dumps(availabilities_by_permit_id), has_availabilities
 
 
 def main(permits, json_output=False):
-    info_by_permit_id = {}
-    for permit_id in permits:
-        info_by_permit_id[permit_id] = check_permit(
-            permit_id,
-            args.start_date,
-            args.end_date,
-            weekends_only=args.weekends_only,
-            min_permits=args.min_permits,
+    # Drop repeated permit IDs so each one is only fetched once.
+    permits = list(dict.fromkeys(permits))
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(MAX_WORKERS, len(permits)))
+    ) as ex:
+        results = ex.map(
+            lambda permit_id: check_permit(
+                permit_id,
+                args.start_date,
+                args.end_date,
+                weekends_only=args.weekends_only,
+                min_permits=args.min_permits,
+            ),
+            permits,
         )
+        info_by_permit_id = dict(zip(permits, results))
 
     if json_output:
         output, has_availabilities = generate_json_output(info_by_permit_id)
@@ -0,0 +1,72 @@
+import json
+import unittest
+from unittest import mock
+
+from utils import jsonlib
+
+
+class TestJsonlib(unittest.TestCase):
+    def setUp(self):
+        self.obj = {
+            233393: {
+                "282": {
+                    "name": "Río Chama",
+                    "dates": [
+                        {"date": "2022-06-22T00:00:00Z", "remaining": 3, "total": 6},
+                    ],
+                }
+            },
+            250986: {},
+        }
+
+    def _dumps_without_extras(self, obj, pretty=False):
+        with mock.patch.object(jsonlib, "orjson", None), mock.patch.object(
+            jsonlib, "simdjson", None
+        ):
+            return jsonlib.dumps(obj, pretty=pretty)
+
+    def testDumpsFallbackIsCompactWithStringKeys(self):
+        self.assertEqual(
+            self._dumps_without_extras(self.obj),
+            '{"233393":{"282":{"name":"Río Chama","dates":[{"date":'
+            '"2022-06-22T00:00:00Z","remaining":3,"total":6}]}},"250986":{}}',
+        )
+
+    def testDumpsFallbackPrettyIndentsByTwoSpaces(self):
+        output = self._dumps_without_extras(self.obj, pretty=True)
+        self.assertTrue(output.startswith('{\n  "233393": {\n    "282": {'))
+        self.assertIn('"name": "Río Chama"', output)
+
+    @unittest.skipIf(jsonlib.orjson is None, "orjson is not installed")
+    def testDumpsMatchesOrjson(self):
+        self.assertEqual(jsonlib.dumps(self.obj), self._dumps_without_extras(self.obj))
+
+    @unittest.skipIf(jsonlib.orjson is None, "orjson is not installed")
+    def testDumpsPrettyMatchesOrjson(self):
+        self.assertEqual(
+            jsonlib.dumps(self.obj, pretty=True),
+            self._dumps_without_extras(self.obj, pretty=True),
+        )
+
+    def testLoadsOnEachPath(self):
+        data = b'{"payload": {"name": "R\\u00edo Chama", "divisions": {}}}'
+        expected = {"payload": {"name": "Río Chama", "divisions": {}}}
+        simdjson = mock.Mock(**{"loads.side_effect": json.loads})
+
+        with mock.patch.object(jsonlib, "orjson", None), mock.patch.object(
+            jsonlib, "simdjson", simdjson
+        ):
+            self.assertEqual(jsonlib.loads(data), expected)
+        simdjson.loads.assert_called_once_with(data)
+
+        with mock.patch.object(jsonlib, "orjson", None), mock.patch.object(
+            jsonlib, "simdjson", None
+        ):
+            self.assertEqual(jsonlib.loads(data), expected)
+
+        if jsonlib.orjson is not None:
+            self.assertEqual(jsonlib.loads(data), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
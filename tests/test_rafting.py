@@ -1,4 +1,8 @@
+import contextlib
+import io
+import logging
 import unittest
+from unittest import mock
 
 import rafting
 from enums.date_format import DateFormat
@@ -6,6 +10,47 @@ from enums.emoji import Emoji
 from utils.rafting_argparser import RaftingArgumentParser
 
 
+PERMIT_INFO = {
+    "payload": {
+        "name": "Some River Permit",
+        "divisions": {"282": {"name": "Deso"}},
+    }
+}
+
+
+def _availability(date_availability=None):
+    """
+    Build a permit availability response. With no dates, no divisions are
+    returned at all.
+    """
+    if date_availability is None:
+        return {"payload": {"availability": {}}}
+    return {
+        "payload": {
+            "availability": {"282": {"date_availability": date_availability}}
+        }
+    }
+
+
+@contextlib.contextmanager
+def _patched_client(availability, permit_info=PERMIT_INFO):
+    """
+    Patch the RecreationClient permit calls. `availability` is either the
+    response for every month or a function of (permit_id, month_date).
+    Yields the (get_permit_availability, get_permit_info) mocks.
+    """
+    if callable(availability):
+        availability_kwargs = {"side_effect": availability}
+    else:
+        availability_kwargs = {"return_value": availability}
+    with mock.patch.object(
+        rafting.RecreationClient, "get_permit_availability", **availability_kwargs
+    ) as get_availability, mock.patch.object(
+        rafting.RecreationClient, "get_permit_info", return_value=permit_info
+    ) as get_permit_info:
+        yield get_availability, get_permit_info
+
+
 class TestRafting(unittest.TestCase):
     def testGetNumAvailableDates_AggregatesDataForMultipleDivisions(self):
         permit_info = {
@@ -68,6 +113,114 @@ class TestRafting(unittest.TestCase):
         self.assertIn("2022-06-24T00:00:00Z", dates)
         self.assertNotIn("2022-06-22T00:00:00Z", dates)
 
+    def testGetNumAvailableDates_BoundsAndWeekendsAcrossLongRange(self):
+        permit_info = {
+            "200": {
+                "name": "Some River Section",
+                "available_dates": [
+                    # Thursday before the range
+                    {"date": "2022-10-13T00:00:00Z", "remaining": 2, "total": 6},
+                    # Saturday, first day of the range
+                    {"date": "2022-10-15T00:00:00Z", "remaining": 2, "total": 6},
+                    # Sunday
+                    {"date": "2022-12-25T00:00:00Z", "remaining": 2, "total": 6},
+                    # Friday
+                    {"date": "2023-03-31T00:00:00Z", "remaining": 2, "total": 6},
+                    # Saturday, the exclusive end date
+                    {"date": "2023-04-15T00:00:00Z", "remaining": 2, "total": 6},
+                ],
+            },
+        }
+
+        _, _, available_divisions = rafting.get_num_available_dates(
+            permit_info,
+            RaftingArgumentParser.TypeConverter.date("2022-10-15"),
+            RaftingArgumentParser.TypeConverter.date("2023-04-15"),
+            weekends_only=True,
+        )
+
+        dates = [d["date"] for d in available_divisions["200"]["dates"]]
+        self.assertEqual(dates, ["2022-10-15T00:00:00Z", "2023-03-31T00:00:00Z"])
+
+    def testGetPermitInformation_CollapsesMonthsInOrder(self):
+        def fake_availability(permit_id, month_date):
+            date_str = month_date.strftime("%Y-%m-02T00:00:00Z")
+            return _availability({date_str: {"remaining": 2, "total": 6}})
+
+        with _patched_client(fake_availability):
+            data = rafting.get_permit_information(
+                233393,
+                RaftingArgumentParser.TypeConverter.date("2022-06-01"),
+                RaftingArgumentParser.TypeConverter.date("2022-09-01"),
+            )
+
+        self.assertEqual(data["282"]["name"], "Deso")
+        dates = [d["date"] for d in data["282"]["available_dates"]]
+        self.assertEqual(
+            dates,
+            [
+                "2022-06-02T00:00:00Z",
+                "2022-07-02T00:00:00Z",
+                "2022-08-02T00:00:00Z",
+            ],
+        )
+
+    def testGetPermitInformation_QueriesEachMonthAcrossYearBoundary(self):
+        with _patched_client(_availability()) as (get_availability, _):
+            rafting.get_permit_information(
+                233393,
+                RaftingArgumentParser.TypeConverter.date("2022-11-15"),
+                RaftingArgumentParser.TypeConverter.date("2023-01-10"),
+            )
+
+        months = sorted(c.args[1] for c in get_availability.call_args_list)
+        self.assertEqual(
+            [m.strftime("%Y-%m-%d") for m in months],
+            ["2022-11-01", "2022-12-01", "2023-01-01"],
+        )
+
+    def testGetPermitInformation_SkipsMonthStartingOnEndDate(self):
+        with _patched_client(_availability()) as (get_availability, _):
+            rafting.get_permit_information(
+                233393,
+                RaftingArgumentParser.TypeConverter.date("2022-06-01"),
+                RaftingArgumentParser.TypeConverter.date("2022-07-01"),
+            )
+
+        get_availability.assert_called_once_with(
+            233393, RaftingArgumentParser.TypeConverter.date("2022-06-01")
+        )
+
+    def testCheckPermit_FetchesPermitInfoOnce(self):
+        availability = _availability(
+            {"2022-06-22T00:00:00Z": {"remaining": 3, "total": 6}}
+        )
+        with _patched_client(availability) as (_, get_permit_info):
+            current, maximum, available_divisions, permit_name = rafting.check_permit(
+                233393,
+                RaftingArgumentParser.TypeConverter.date("2022-06-01"),
+                RaftingArgumentParser.TypeConverter.date("2022-07-01"),
+            )
+
+        get_permit_info.assert_called_once_with(233393)
+        self.assertEqual(permit_name, "Some River Permit")
+        self.assertEqual((current, maximum), (1, 1))
+        self.assertIn("282", available_divisions)
+
+    def testCheckPermit_SkipsDebugDumpWhenNotDebugging(self):
+        with _patched_client(_availability()), mock.patch.object(
+            rafting.jsonlib, "dumps"
+        ) as dumps:
+            self.addCleanup(rafting.LOG.setLevel, rafting.LOG.level)
+            rafting.LOG.setLevel(logging.INFO)
+            rafting.check_permit(
+                233393,
+                RaftingArgumentParser.TypeConverter.date("2022-06-01"),
+                RaftingArgumentParser.TypeConverter.date("2022-07-01"),
+            )
+
+        dumps.assert_not_called()
+
     def testGenerateOutputToHuman_DefaultOutputWithAvailabilities(self):
         """Single division permit: no division headers shown."""
         start_date = RaftingArgumentParser.TypeConverter.date("2022-06-01")
@@ -311,6 +464,20 @@ class TestRaftingArgParser(unittest.TestCase):
         parsed = RaftingArgumentParser().parse_args(args)
         self.assertEqual(parsed.min_permits, 3)
 
+    def testReadsPermitsFromStdinSkippingBlankLines(self):
+        args = self.start_date + self.end_date + ["--stdin"]
+        with mock.patch("sys.stdin", io.StringIO("233393\n\n  234567 \n")):
+            parsed = RaftingArgumentParser().parse_args(args)
+        self.assertEqual(parsed.permits, [233393, 234567])
+
+    def testRejectsMalformedPermitFromStdin(self):
+        args = self.start_date + self.end_date + ["--stdin"]
+        with mock.patch("sys.stdin", io.StringIO("233393\nabc\n")), mock.patch(
+            "sys.stderr", io.StringIO()
+        ):
+            with self.assertRaises(SystemExit):
+                RaftingArgumentParser().parse_args(args)
+
     def testDefaultMinPermitsIsOne(self):
         parsed = RaftingArgumentParser().parse_args(self.default_args)
         self.assertEqual(parsed.min_permits, 1)
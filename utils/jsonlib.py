@@ -0,0 +1,46 @@
+"""
+Thin wrapper around the fastest JSON library available.
+
+Prefers orjson, then pysimdjson (parsing only), then falls back to the
+stdlib json module so the scraper keeps working without any extras.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+
+def loads(data):
+    """
+    Parse a JSON document from bytes or str.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if simdjson is not None:
+        return simdjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, pretty=False):
+    """
+    Serialize obj to a JSON str, indented by two spaces if pretty is set.
+    Non-string dict keys (e.g. permit IDs) are converted to strings. The
+    stdlib fallback is configured to match orjson's compact,
+    non-ASCII-escaping output so results don't depend on which library is
+    installed.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode()
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
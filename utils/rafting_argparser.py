@@ -5,6 +5,8 @@ from datetime import datetime
 
 from enums.date_format import DateFormat
 
+INPUT_DATE_FORMAT = DateFormat.INPUT_DATE_FORMAT.value
+
 
 class RaftingArgumentParser(argparse.ArgumentParser):
     def __init__(self):
@@ -71,16 +73,26 @@ class RaftingArgumentParser(argparse.ArgumentParser):
 
     def parse_args(self, args=None, namespace=None):
         args = super().parse_args(args, namespace)
-        args.permits = args.permits or [int(p.strip()) for p in sys.stdin]
+        if not args.permits:
+            args.permits = self._read_permits(sys.stdin)
         return args
 
+    def _read_permits(self, stream):
+        # Split on any whitespace in one pass, so blank lines and several IDs
+        # per line are fine. Anything else is reported as a usage error.
+        permits = []
+        for p in stream.read().split():
+            try:
+                permits.append(int(p))
+            except ValueError:
+                self.error("Not a valid permit ID: '{0}'".format(p))
+        return permits
+
     class TypeConverter:
         @classmethod
         def date(cls, date_str):
             try:
-                return datetime.strptime(
-                    date_str, DateFormat.INPUT_DATE_FORMAT.value
-                )
+                return datetime.strptime(date_str, INPUT_DATE_FORMAT)
             except ValueError as e:
                 msg = "Not a valid date: '{0}'.".format(date_str)
                 logging.critical(e)